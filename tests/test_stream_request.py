@@ -0,0 +1,43 @@
+"""
+Regression tests for the streaming request path
+"""
+
+import gzip
+import io
+from unittest import mock
+
+import orjson
+import urllib3
+
+from ticktick.utils.ticktick_api import TickTickClient
+
+
+def _gzip_response(payload):
+    """Build a stub response whose raw body is gzip-compressed, as served by
+    any server honoring the session's Accept-Encoding header"""
+    raw = urllib3.response.HTTPResponse(
+        body=io.BytesIO(gzip.compress(orjson.dumps(payload))),
+        headers={"Content-Encoding": "gzip"},
+        status=200,
+        preload_content=False,
+        decode_content=False,
+    )
+    response = mock.MagicMock()
+    response.raise_for_status.return_value = None
+    # No Content-Length, so _stream_request takes the incremental ijson path
+    response.headers = {}
+    response.raw = raw
+    response.__enter__.return_value = response
+    response.__exit__.return_value = False
+    return response
+
+
+def test_stream_request_decodes_compressed_bodies():
+    # ijson must receive decoded JSON, not the compressed wire bytes
+    client = TickTickClient("client-id", "client-secret", access_token="token")
+    tasks = [{"id": "1", "title": "Zap: one"}, {"id": "2", "title": "Zap: two"}]
+    response = _gzip_response({"tasks": tasks})
+
+    with mock.patch.object(client.session, "request", return_value=response):
+        assert list(client._stream_request("GET", "v1", "/project/p/data", "tasks.item")) == tasks
+    client.close()
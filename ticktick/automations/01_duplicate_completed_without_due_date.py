@@ -1,90 +1,65 @@
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from dotenv import load_dotenv
 from loguru import logger
 
-from ticktick.utils import TickTickClient, load_state, save_state
+from ticktick.utils import TickTickClient, append_state_delta, load_state
+from ticktick.utils.filters import duplicate_task_without_due_date, is_valid_task
 
 load_dotenv()
 
 
-def duplicate_task_without_due_date(original_task: dict[str, Any]) -> dict[str, Any]:
-    """
-    Create a duplicate of the task without due date
-
-    Args:
-        original_task: Original completed task
-
-    Returns:
-        New task data object
-    """
-    # Create new task with same properties
-    new_task = {
-        "title": original_task.get("title"),
-        "projectId": original_task.get("projectId"),
-        "content": original_task.get("content", ""),
-        "desc": original_task.get("desc", ""),
-        "priority": original_task.get("priority", 0),
-    }
-
-    # Copy items (checklist) if present
-    if "items" in original_task and original_task["items"]:
-        new_task["items"] = original_task["items"]
-
-    return new_task
-
-
-def automation(pending_valid_tasks_path: str):
+def automation(client: TickTickClient, pending_valid_tasks_path: str):
     """Duplicates valid tasks with no due date upon completion
 
     Definition of a valid task:
     - Task title should start with the string "Zap:" (case insensitive)
 
     Args:
+        client: TickTick client shared across runs so pooled connections are reused
         pending_valid_tasks_path: Path to JSON file containing state of valid tasks
     """
-    valid_task_title_prefix = "zap:"
-
-    client = TickTickClient(
-        os.environ["TICKTICK_CLIENT_ID"],
-        os.environ["TICKTICK_CLIENT_SECRET"],
-        os.environ["TICKTICK_ACCESS_TOKEN"],
-    )
-
     old_state = load_state(pending_valid_tasks_path)
     logger.info(f"Loaded {len(old_state)} tasks from {pending_valid_tasks_path}")
     new_state = {task["id"]: task for task in client.get_all_pending_tasks()}
     logger.info(f"Found {len(new_state)} pending tasks")
 
-    for task_id in set(old_state.keys()) - set(new_state.keys()):
-        logger.info(f"Task not found in current state: {task_id}")
-
-        # Update the task with the new state
-        task = old_state[task_id]
+    def reconcile(task: dict[str, Any]) -> dict[str, Any] | None:
+        """Fetch the latest version of a missing task and build its duplicate if it was completed"""
         task = client.get_task(task["projectId"], task["id"])
 
         # Check if task was completed
         if task["status"] == 2:
             # Task was completed
             logger.info(f"Duplicating {task['title']}")
+            return duplicate_task_without_due_date(task)
+        return None
 
-            # Duplicate the task
-            new_task = duplicate_task_without_due_date(task)
-            new_task = client.create_task(new_task)
+    # Pass 1: find tasks that were completed and build their duplicates.
+    # The per-task lookups are independent network calls, so overlap them.
+    missing_tasks = []
+    for task_id in old_state.keys() - new_state.keys():
+        logger.info(f"Task not found in current state: {task_id}")
+        missing_tasks.append(old_state[task_id])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pending_duplicates = [duplicate for duplicate in executor.map(reconcile, missing_tasks) if duplicate]
 
-            # Mark as processed
-            new_state[new_task["id"]] = new_task
+    # Pass 2: create all duplicates in one bulk call instead of one round trip each
+    for new_task in client.create_tasks_bulk(pending_duplicates):
+        # Mark as processed
+        new_state[new_task["id"]] = new_task
 
     # Limit new state to only valid tasks
-    new_state = {
-        key: value for key, value in new_state.items() if value["title"].lower().startswith(valid_task_title_prefix)
-    }
+    new_state = {key: value for key, value in new_state.items() if is_valid_task(value)}
 
-    # Save new state
-    save_state(pending_valid_tasks_path, new_state)
-    logger.info(f"Saved {len(new_state)} tasks to {pending_valid_tasks_path}")
+    # Save only the delta to the append-only log instead of rewriting the full state
+    num_changes = append_state_delta(pending_valid_tasks_path, old_state, new_state)
+    if num_changes:
+        logger.info(f"Saved {num_changes} changes ({len(new_state)} tasks) to {pending_valid_tasks_path}")
 
 
 def mac_alert(title, message):
@@ -106,16 +81,34 @@ if __name__ == "__main__":
         os.path.join(os.path.dirname(__file__), "..", "rsrc", "01_pending_valid_tasks.json")
     )
 
+    # Build the client once so every scheduled run shares the pooled session
+    client = TickTickClient(
+        os.environ["TICKTICK_CLIENT_ID"],
+        os.environ["TICKTICK_CLIENT_SECRET"],
+        os.environ["TICKTICK_ACCESS_TOKEN"],
+    )
+    # close() also flushes the ETag cache so the next process starts with
+    # warm conditional GETs; registering session.close would skip that
+    atexit.register(client.close)
+
     while True:
         # Schedule the job if not scheduled till now
         if not schedule.get_jobs():
             logger.info("Starting automation")
             mac_alert("Ticktick", "Automation (re)starting")
-            schedule.every().minute.do(automation, pending_valid_tasks_path)
-            automation(pending_valid_tasks_path)
+            schedule.every().minute.do(automation, client, pending_valid_tasks_path)
+            automation(client, pending_valid_tasks_path)
 
         try:
             schedule.run_pending()
         except Exception as e:
             mac_alert("Ticktick", f"Automation error: {e}")
-        time.sleep(1)  # Sleep for a short interval to avoid high CPU usage
+
+        # Sleep until the next job is actually due instead of waking every
+        # second. The 1s floor matters: a job that raised is not rescheduled,
+        # leaving idle_seconds() negative, and without the floor the loop
+        # would re-run the failing job (and its alert popup) back to back
+        idle = schedule.idle_seconds()
+        if idle is None:
+            idle = 60
+        time.sleep(max(idle, 1))
@@ -1,2 +1,4 @@
-from .helpers import load_state, save_state
+from .filters import duplicate_task_without_due_date, is_valid_task
+from .helpers import append_state_delta, load_state, load_token, save_state, save_token
 from .ticktick_api import TickTickAPIError, TickTickClient
+from .ticktick_api_async import AsyncTickTickClient
@@ -0,0 +1,77 @@
+"""
+Shared task filtering and duplication helpers for TickTick automations
+"""
+
+import re
+from typing import Any
+
+# Precomputed once at import so the per-task check doesn't rebuild it every poll.
+# The compiled matcher does the case-insensitive prefix check at C level
+# without allocating a lowercased copy of every title.
+VALID_TASK_TITLE_PREFIX = "zap:"
+_valid_title_match = re.compile(re.escape(VALID_TASK_TITLE_PREFIX), re.IGNORECASE).match
+
+# Validity results are pure in (id, title); cache them so repeated polls skip
+# re-matching the same titles. Entries are busted when a task is renamed.
+_valid_task_cache: dict[str, tuple[str, bool]] = {}
+
+# Fields carried over to a duplicate, paired with their defaults. Driving the
+# copy from this table keeps the hot builder to a single comprehension with
+# one dict lookup per field.
+_DUPLICATE_FIELDS = (
+    ("title", None),
+    ("projectId", None),
+    ("content", ""),
+    ("desc", ""),
+    ("priority", 0),
+    ("tags", []),
+)
+
+
+def is_valid_task(task: dict[str, Any]) -> bool:
+    """
+    Check whether a task should be tracked by the duplication automations
+
+    Definition of a valid task:
+    - Task title should start with the string "Zap:" (case insensitive)
+
+    Args:
+        task: Task object
+
+    Returns:
+        True if the task is valid
+    """
+    task_id = task.get("id")
+    title = task.get("title", "")
+
+    if task_id is not None:
+        cached = _valid_task_cache.get(task_id)
+        if cached is not None and cached[0] == title:
+            return cached[1]
+
+    valid = _valid_title_match(title) is not None
+    if task_id is not None:
+        _valid_task_cache[task_id] = (title, valid)
+    return valid
+
+
+def duplicate_task_without_due_date(original_task: dict[str, Any]) -> dict[str, Any]:
+    """
+    Create a duplicate of the task without due date
+
+    Args:
+        original_task: Original completed task
+
+    Returns:
+        New task data object
+    """
+    # Create new task with same properties
+    new_task = {key: original_task.get(key, default) for key, default in _DUPLICATE_FIELDS}
+
+    # Copy items (checklist) if present, keeping only the fields the create
+    # endpoint accepts: ids are server-assigned and completion state is reset,
+    # so shipping the full item objects would only inflate the POST body
+    if items := original_task.get("items"):
+        new_task["items"] = [{"title": item.get("title", ""), "status": 0} for item in items]
+
+    return new_task
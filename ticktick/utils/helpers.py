@@ -2,42 +2,155 @@
 Utility functions for TickTick automations
 """
 
-import json
 import logging
 import os
-from datetime import datetime
-from typing import Any, Dict, Set
+import time
+from typing import Any, Dict, Optional
+
+import orjson
+
+# Don't reuse a persisted token that expires within this many seconds
+TOKEN_EXPIRY_MARGIN = 60
+
+
+def _state_log_path(state_file: str) -> str:
+    """Path of the append-only delta log kept next to the state snapshot"""
+    return state_file + ".log"
 
 
 def load_state(state_file: str) -> Dict[str, Any]:
     """
     Load state from JSON file
 
+    Reads the snapshot file, then replays the append-only delta log written by
+    append_state_delta (if one exists) to reconstruct the latest state.
+
     Args:
         state_file: Path to state file
 
     Returns:
         Dictionary containing state data
     """
+    state: Dict[str, Any] = {}
     if os.path.exists(state_file):
         try:
-            with open(state_file, "r") as f:
-                return json.load(f)
+            with open(state_file, "rb") as f:
+                state = orjson.loads(f.read())
         except Exception as e:
             logging.warning(f"Failed to load state from {state_file}: {e}")
-    return {}
+
+    log_file = _state_log_path(state_file)
+    if os.path.exists(log_file):
+        try:
+            with open(log_file, "rb") as f:
+                for line in f:
+                    entry = orjson.loads(line)
+                    if entry["value"] is None:
+                        state.pop(entry["key"], None)
+                    else:
+                        state[entry["key"]] = entry["value"]
+        except Exception as e:
+            logging.warning(f"Failed to replay state log {log_file}: {e}")
+    return state
+
+
+def append_state_delta(state_file: str, old_state: Dict[str, Any], new_state: Dict[str, Any]) -> int:
+    """
+    Persist only the difference between two states to the delta log
+
+    Each changed entry is appended as one JSON line (value null marks a
+    removal), so the per-run write cost is proportional to the delta instead
+    of the full state. When nothing changed, no file is touched at all. Once
+    the log grows past twice the live state size, it is compacted back into
+    the snapshot file.
+
+    Args:
+        state_file: Path to state file
+        old_state: State as it was loaded at the start of the run
+        new_state: State to persist
+
+    Returns:
+        Number of delta entries written (0 when the state was unchanged)
+    """
+    delta = [
+        {"key": key, "value": value} for key, value in new_state.items() if old_state.get(key) != value
+    ] + [{"key": key, "value": None} for key in old_state.keys() - new_state.keys()]
+    if not delta:
+        return 0
+
+    log_file = _state_log_path(state_file)
+    try:
+        with open(log_file, "ab") as f:
+            for entry in delta:
+                f.write(orjson.dumps(entry, default=list) + b"\n")
+
+        with open(log_file, "rb") as f:
+            log_lines = sum(1 for _ in f)
+        if log_lines > 2 * max(len(new_state), 1):
+            save_state(state_file, new_state)
+            os.remove(log_file)
+    except Exception as e:
+        logging.error(f"Failed to append state delta to {log_file}: {e}")
+    return len(delta)
 
 
 def save_state(state_file: str, state_data: Dict[str, Any]):
     """
     Save state to JSON file
 
+    The data is written to a temporary file and moved into place with
+    os.replace, so a crash mid-write can never leave a truncated state file.
+
     Args:
         state_file: Path to state file
         state_data: Dictionary containing state data
     """
+    tmp_file = state_file + ".tmp"
     try:
-        with open(state_file, "w") as f:
-            json.dump(state_data, f, indent=2)
+        with open(tmp_file, "wb") as f:
+            # default=list lets values hold sets: they are iterated straight
+            # into the output buffer instead of being materialized first
+            f.write(orjson.dumps(state_data, default=list))
+        os.replace(tmp_file, state_file)
     except Exception as e:
         logging.error(f"Failed to save state to {state_file}: {e}")
+
+
+def save_token(token_file: str, token_data: Dict[str, Any]):
+    """
+    Persist an OAuth token response so later runs can skip re-authentication
+
+    The relative expires_in from the response is converted to an absolute
+    epoch timestamp at save time.
+
+    Args:
+        token_file: Path to token file
+        token_data: OAuth token response (access_token, refresh_token, expires_in)
+    """
+    save_state(
+        token_file,
+        {
+            "access_token": token_data.get("access_token"),
+            "refresh_token": token_data.get("refresh_token"),
+            "expires_at": time.time() + token_data.get("expires_in", 3600),
+        },
+    )
+
+
+def load_token(token_file: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a persisted OAuth token if it is still usable
+
+    Args:
+        token_file: Path to token file
+
+    Returns:
+        Token data dict, or None when no token is stored or it expires within
+        TOKEN_EXPIRY_MARGIN seconds
+    """
+    token_data = load_state(token_file)
+    if not token_data.get("access_token"):
+        return None
+    if token_data.get("expires_at", 0) < time.time() + TOKEN_EXPIRY_MARGIN:
+        return None
+    return token_data
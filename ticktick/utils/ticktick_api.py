@@ -5,11 +5,85 @@ This module provides a wrapper around the TickTick Open API with OAuth2 authenti
 Documentation: https://developer.ticktick.com/api
 """
 
+import hashlib
 import logging
+import os
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Any, Iterator
 
+import ijson
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .helpers import load_token, save_token
+
+# Where OAuth tokens are cached across runs, one file per client id
+TOKEN_CACHE_DIR = os.path.expanduser("~/.cache/ticktick")
+
+# Where the ETag cache is persisted so conditional GETs work from the first
+# request of a fresh process
+ETAG_CACHE_FILE = os.path.join(TOKEN_CACHE_DIR, "etags.json")
+
+
+@lru_cache(maxsize=4096)
+def _completed_time_ts(completed_time: str) -> float | None:
+    """
+    Parse a task's completedTime string into epoch seconds
+
+    Memoized: repeated polls see mostly the same completedTime strings, and a
+    cache hit is a hash lookup versus a full ISO parse.
+
+    Args:
+        completed_time: ISO-8601 timestamp, possibly with a Z suffix
+
+    Returns:
+        Epoch seconds, or None if the string is missing or unparseable
+    """
+    try:
+        return datetime.fromisoformat(completed_time.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError):
+        return None
+
+
+def _persist_etag_cache(etag_cache: dict, lock: threading.Lock, logger: logging.Logger) -> None:
+    """
+    Write an ETag cache to disk; best-effort, failures only cost future 304s
+
+    Module-level rather than a method so the GC finalizer can flush the cache
+    without holding a reference to the client instance.
+    """
+    with lock:
+        if not etag_cache:
+            return
+        snapshot = list(etag_cache.items())
+    entries = [{"url": url, "params": params, "etag": etag, "body": body} for (url, params), (etag, body) in snapshot]
+    try:
+        os.makedirs(TOKEN_CACHE_DIR, exist_ok=True)
+        # Per-process tmp name so concurrent processes don't rename each
+        # other's half-written files out from underneath os.replace
+        tmp_file = f"{ETAG_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(entries, default=list))
+        os.replace(tmp_file, ETAG_CACHE_FILE)
+    except OSError as e:
+        logger.warning("Failed to persist ETag cache: %s", e)
+
+
+def _finalize_client(session, etag_cache: dict, lock: threading.Lock, logger: logging.Logger) -> None:
+    """GC fallback for clients dropped without close(): flush the ETag cache,
+    then release the pooled sockets"""
+    _persist_etag_cache(etag_cache, lock, logger)
+    session.close()
 
 
 class TickTickAPIError(Exception):
@@ -25,7 +99,71 @@ class TickTickClient:
     BASE_URL_v2 = "https://api.ticktick.com/api/v2"
     AUTH_URL = "https://ticktick.com/oauth/token"
 
-    def __init__(self, client_id: str, client_secret: str, access_token: str | None = None):
+    # Maximum task creations per second, kept just under the API's rate limit
+    CREATE_RATE_LIMIT = 20
+
+    # How long a fetched project list stays fresh; projects change rarely
+    PROJECTS_CACHE_TTL = 300
+
+    # Refresh the access token this many seconds before it actually expires,
+    # so no request ever burns a round trip on a 401
+    TOKEN_REFRESH_MARGIN = 300
+
+    # Retry policy for rate-limited / transient server errors
+    MAX_ATTEMPTS = 5
+    RETRYABLE_STATUSES = (429, 502, 503, 504)
+    BACKOFF_CAP = 60.0
+
+    # Start pacing requests once the server reports this few rate-limit
+    # slots left in the current window
+    RATE_REMAINING_THRESHOLD = 10
+
+    # Upper bound on retained ETag entries; each holds a parsed body and every
+    # distinct completed-window query mints a new key, so an unbounded cache
+    # would grow for the life of the process
+    ETAG_CACHE_MAX = 256
+
+    # Responses smaller than this are parsed in one go even in stream mode;
+    # incremental parsing only pays off on large bodies
+    STREAM_THRESHOLD = 256 * 1024
+
+    # Default (connect, read) timeout so a stalled endpoint can never pin a
+    # worker thread (and its pool slot) forever; callers may override per call
+    DEFAULT_TIMEOUT = (5, 30)
+
+    # Fixed attribute set: skips the per-instance __dict__ and makes the
+    # attribute lookups on every request slightly cheaper
+    __slots__ = (
+        "client_id",
+        "client_secret",
+        "access_token",
+        "refresh_token",
+        "token_expires_at",
+        "token_deadline",
+        "session",
+        "logger",
+        "_token_refresh_lock",
+        "_base_urls",
+        "_etag_cache",
+        "_etag_cache_lock",
+        "_etag_cache_dirty",
+        "_create_bucket",
+        "_create_bucket_lock",
+        "_pace_until",
+        "_projects_cache",
+        "_server_filters_completed",
+        "_token_cache_file",
+        "_finalizer",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        access_token: str | None = None,
+        pool_maxsize: int = 20,
+    ):
         """
         Initialize TickTick client with OAuth credentials
 
@@ -33,17 +171,106 @@ class TickTickClient:
             client_id: OAuth client ID
             client_secret: OAuth client secret
             access_token: cached access token
+            pool_maxsize: Size of the HTTP connection pool; raise it if more
+                threads than this issue requests concurrently, otherwise the
+                extra connections are opened and dropped instead of pooled
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.access_token = access_token
+        self.refresh_token = None
+        # Wall-clock expiry is kept for logging/persistence only; the refresh
+        # check runs against the monotonic deadline, immune to NTP/DST jumps
         self.token_expires_at = None
+        self.token_deadline = None
+        self._token_refresh_lock = threading.Lock()
+        # Version -> base URL lookup, resolved once instead of branching per request
+        self._base_urls = {"v1": self.BASE_URL_v1, "v2": self.BASE_URL_v2}
         self.session = requests.Session()
+        # Pool connections so repeated calls (and the thread pool in
+        # create_tasks_bulk) reuse TCP+TLS connections instead of
+        # re-handshaking. The adapter only retries connection-level failures;
+        # status-code retries are handled in _make_request with jitter, so
+        # total is unset (it defaults to 10 and would count statuses) and
+        # urllib3's own Retry-After handling is disabled - it would sleep on
+        # 429/503 before _make_request ever saw them, and it rejects the
+        # fractional Retry-After values the outer loop supports. The default
+        # allowed_methods (idempotent only) is kept deliberately: it gates
+        # read-error retries, and resending a POST whose response was lost
+        # after the server processed it would create duplicate tasks
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=None,
+                connect=3,
+                read=3,
+                backoff_factor=0.3,
+                respect_retry_after_header=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # JSON payloads compress well; advertise brotli alongside gzip and
+        # let urllib3 decompress transparently
+        self.session.headers["Accept-Encoding"] = "gzip, br"
+        # ETag cache for conditional GETs: (url, params) -> (etag, parsed body),
+        # warmed from the on-disk copy left by previous runs
+        self._etag_cache: dict[tuple, tuple[str, Any]] = self._load_etag_cache()
+        # Guards the cache against the thread-pooled bulk paths; the dirty
+        # flag debounces persistence to close() instead of every response
+        self._etag_cache_lock = threading.Lock()
+        self._etag_cache_dirty = False
+        # Token bucket of recent create timestamps; lock guards concurrent
+        # access from the create_tasks_bulk thread pool
+        self._create_bucket: deque[float] = deque()
+        self._create_bucket_lock = threading.Lock()
+        # Monotonic time before which no request should be sent, set from the
+        # server's rate-limit headers when the window is nearly exhausted
+        self._pace_until = 0.0
+        # TTL cache for the project list: (fetch time, projects)
+        self._projects_cache: tuple[float, list[dict[str, Any]]] | None = None
+        # Whether the undocumented completed endpoint honors the `from`
+        # param; None until the first filtered fetch probes it
+        self._server_filters_completed: bool | None = None
         self.logger = logging.getLogger(__name__)
 
+        # Tokens are cached on disk per client id (hashed, so the id itself
+        # never lands in a filename); a fresh process can pick up a still-valid
+        # token without any auth round trip
+        digest = hashlib.sha256(client_id.encode()).hexdigest()[:16]
+        self._token_cache_file = os.path.join(TOKEN_CACHE_DIR, f"token_{digest}.json")
+        if not access_token:
+            cached_token = load_token(self._token_cache_file)
+            if cached_token:
+                access_token = cached_token["access_token"]
+                self.refresh_token = cached_token.get("refresh_token")
+                self.token_expires_at = datetime.fromtimestamp(cached_token["expires_at"])
+                self.token_deadline = time.monotonic() + (cached_token["expires_at"] - time.time())
+
         if access_token:
             self._update_auth_header(access_token)
 
+        # Safety net: flush the ETag cache and close the pooled sockets when
+        # the client is collected without going through close() / the context
+        # manager. The finalizer is handed the state directly - a bound method
+        # would keep the instance alive and never fire
+        self._finalizer = weakref.finalize(
+            self, _finalize_client, self.session, self._etag_cache, self._etag_cache_lock, self.logger
+        )
+
+    def close(self):
+        """Flush the ETag cache and close the session's pooled connections"""
+        self._finalizer.detach()
+        self._save_etag_cache()
+        self.session.close()
+
+    def __enter__(self) -> "TickTickClient":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def _update_auth_header(self, access_token: str):
         """Update session headers with access token"""
         self.access_token = access_token
@@ -70,7 +297,11 @@ class TickTickClient:
             )
 
         try:
-            response = requests.post(
+            # Use the pooled session (not module-level requests.post) so the
+            # token exchange reuses a warm connection instead of paying a
+            # fresh TCP+TLS handshake; the form content type overrides the
+            # session's JSON default for this one call
+            response = self.session.post(
                 self.AUTH_URL,
                 data={
                     "client_id": self.client_id,
@@ -79,21 +310,173 @@ class TickTickClient:
                     "grant_type": "authorization_code",
                     "redirect_uri": redirect_uri or "http://localhost",
                 },
+                # A None value strips the session's (possibly stale) bearer
+                # token from this call; the token endpoint authenticates via
+                # the client credentials in the form body
+                headers={"Content-Type": "application/x-www-form-urlencoded", "Authorization": None},
+                timeout=self.DEFAULT_TIMEOUT,
             )
             response.raise_for_status()
 
             token_data = response.json()
-            access_token = token_data.get("access_token")
-            expires_in = token_data.get("expires_in", 3600)
-
-            self._update_auth_header(access_token)
-            self.token_expires_at = datetime.now() + timedelta(seconds=expires_in)
-
+            self._store_token_data(token_data)
             return token_data
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Authentication failed: {e}")
+            self.logger.error("Authentication failed: %s", e)
             raise TickTickAPIError(f"Authentication failed: {e}")
 
+    def _store_token_data(self, token_data: dict[str, Any]):
+        """Apply an OAuth token response to the client and cache it on disk"""
+        self._update_auth_header(token_data.get("access_token"))
+        self.refresh_token = token_data.get("refresh_token", self.refresh_token)
+        expires_in = token_data.get("expires_in", 3600)
+        self.token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+        self.token_deadline = time.monotonic() + expires_in
+
+        # Best-effort cache write so the next process reuses this token;
+        # save_token writes atomically via a tmp file + rename
+        try:
+            os.makedirs(TOKEN_CACHE_DIR, exist_ok=True)
+            save_token(self._token_cache_file, token_data)
+        except OSError as e:
+            self.logger.warning("Failed to cache token: %s", e)
+
+    def _token_needs_refresh(self) -> bool:
+        """Check whether the access token is expired or about to expire"""
+        if self.token_deadline is None:
+            return False
+        return time.monotonic() >= self.token_deadline - self.TOKEN_REFRESH_MARGIN
+
+    def _refresh_access_token(self):
+        """
+        Exchange the refresh token for a fresh access token
+
+        Called proactively before the current token expires so requests never
+        pay a wasted round trip that comes back 401.
+
+        Raises:
+            TickTickAPIError: If the refresh request fails
+        """
+        with self._token_refresh_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if not self._token_needs_refresh():
+                return
+
+            try:
+                response = self.session.post(
+                    self.AUTH_URL,
+                    data={
+                        "client_id": self.client_id,
+                        "client_secret": self.client_secret,
+                        "refresh_token": self.refresh_token,
+                        "grant_type": "refresh_token",
+                    },
+                    # A None value strips the session's (possibly stale) bearer
+                    # token from this call; the token endpoint authenticates via
+                    # the client credentials in the form body
+                    headers={"Content-Type": "application/x-www-form-urlencoded", "Authorization": None},
+                    timeout=self.DEFAULT_TIMEOUT,
+                )
+                response.raise_for_status()
+                self._store_token_data(response.json())
+            except requests.exceptions.RequestException as e:
+                self.logger.error("Token refresh failed: %s", e)
+                raise TickTickAPIError(f"Token refresh failed: {e}")
+
+    @staticmethod
+    def _load_etag_cache() -> dict[tuple, tuple[str, Any]]:
+        """Load the persisted ETag cache, or an empty one if absent/corrupt"""
+        try:
+            with open(ETAG_CACHE_FILE, "rb") as f:
+                entries = orjson.loads(f.read())
+            return {
+                (
+                    entry["url"],
+                    tuple(tuple(pair) for pair in entry["params"]) if entry["params"] is not None else None,
+                ): (entry["etag"], entry["body"])
+                for entry in entries
+            }
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            return {}
+
+    def _save_etag_cache(self):
+        """Persist the ETag cache when it has changed since the last flush"""
+        with self._etag_cache_lock:
+            if not self._etag_cache_dirty:
+                return
+            self._etag_cache_dirty = False
+        _persist_etag_cache(self._etag_cache, self._etag_cache_lock, self.logger)
+
+    def _build_url(self, api_ver: str, endpoint: str) -> str:
+        """Resolve an endpoint path against the base URL for the given API version"""
+        try:
+            return self._base_urls[api_ver] + endpoint
+        except KeyError:
+            raise ValueError(f"Invalid API version: {api_ver}")
+
+    def _stream_request(self, method: str, api_ver: str, endpoint: str, item_prefix: str, **kwargs) -> Iterator[Any]:
+        """
+        Make HTTP request to TickTick API and stream-parse the response
+
+        Items matching `item_prefix` (ijson notation) are yielded one at a
+        time while the body is still being received, so peak memory stays at
+        one item's footprint instead of the whole payload.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            api_ver: API version. v1 or v2 (undocumented)
+            endpoint: API endpoint path
+            item_prefix: ijson prefix of the items to yield (e.g. "item")
+            **kwargs: Additional arguments to pass to requests
+
+        Yields:
+            Parsed items
+
+        Raises:
+            TickTickAPIError: If the API request fails
+        """
+        if not self.access_token:
+            raise TickTickAPIError("Not authenticated. Please authenticate first.")
+
+        url = self._build_url(api_ver, endpoint)
+        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
+        try:
+            with self.session.request(method, url, stream=True, **kwargs) as response:
+                response.raise_for_status()
+
+                # For small bodies the incremental parser's per-event overhead
+                # outweighs its memory savings; parse those in one orjson call
+                content_length = response.headers.get("Content-Length")
+                if content_length is not None and int(content_length) < self.STREAM_THRESHOLD:
+                    yield from self._extract_items(orjson.loads(response.content), item_prefix)
+                else:
+                    # requests leaves raw undecoded in stream mode; without
+                    # this the parser would see gzip/brotli bytes, not JSON
+                    response.raw.decode_content = True
+                    yield from ijson.items(response.raw, item_prefix)
+        except requests.exceptions.RequestException as e:
+            self.logger.error("API request failed: %s", e)
+            raise TickTickAPIError(f"API request failed: {e}")
+
+    @staticmethod
+    def _extract_items(data: Any, item_prefix: str) -> list[Any]:
+        """Resolve an ijson item prefix (e.g. "item", "tasks.item") against a fully parsed body"""
+        for part in item_prefix.split("."):
+            if part == "item":
+                break
+            data = data.get(part, {}) if isinstance(data, dict) else {}
+        return data if isinstance(data, list) else []
+
+    def _get_list(self, api_ver: str, endpoint: str, **kwargs) -> list[Any]:
+        """
+        GET a list-shaped endpoint, normalizing unexpected shapes to []
+
+        The single seam for list endpoints; shape validation or specialized
+        parse paths belong here rather than in each caller.
+        """
+        response = self._make_request("GET", api_ver, endpoint, **kwargs)
+        return response if isinstance(response, list) else []
+
     def _make_request(self, method: str, api_ver: str, endpoint: str, **kwargs) -> dict[str, Any]:
         """
         Make HTTP request to TickTick API
@@ -113,38 +496,119 @@ class TickTickClient:
         if not self.access_token:
             raise TickTickAPIError("Not authenticated. Please authenticate first.")
 
-        if api_ver == "v1":
-            url = f"{self.BASE_URL_v1}{endpoint}"
-        elif api_ver == "v2":
-            url = f"{self.BASE_URL_v2}{endpoint}"
-        else:
-            raise ValueError(f"Invalid API version: {api_ver}")
-
+        # Refresh the token shortly before expiry instead of reacting to 401s
+        if self.refresh_token and self._token_needs_refresh():
+            self._refresh_access_token()
+
+        url = self._build_url(api_ver, endpoint)
+
+        # Conditional GET: if we hold an ETag for this url+params, let the
+        # server answer 304 and skip the payload transfer + parse entirely.
+        # Params are part of the key so differently-filtered calls to the
+        # same endpoint don't reuse each other's bodies. Params may be a dict
+        # or a sequence of pairs (both accepted by requests)
+        cached = None
+        cache_key = None
+        if method == "GET":
+            params = kwargs.get("params")
+            if not params:
+                key_params = None
+            elif isinstance(params, dict):
+                key_params = tuple(sorted(params.items()))
+            else:
+                key_params = tuple(params)
+            cache_key = (url, key_params)
+            with self._etag_cache_lock:
+                cached = self._etag_cache.get(cache_key)
+        if cached is not None:
+            kwargs.setdefault("headers", {})["If-None-Match"] = cached[0]
+
+        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
         try:
-            response = self.session.request(method, url, **kwargs)
+            for attempt in range(self.MAX_ATTEMPTS):
+                # Wait out any pacing delay derived from earlier responses so
+                # the remaining rate budget is spread over its reset window
+                # instead of being burned into a 429
+                pace = self._pace_until - time.monotonic()
+                if pace > 0:
+                    time.sleep(pace)
+
+                response = self.session.request(method, url, **kwargs)
+                self._update_pacing(response.headers)
+                if response.status_code not in self.RETRYABLE_STATUSES or attempt == self.MAX_ATTEMPTS - 1:
+                    break
+
+                # A gateway can return 502/504 after the origin already
+                # applied a write, so resending anything but a GET on those
+                # risks duplicates; 429/503 mean the request was not processed
+                # and are safe to retry for every method
+                if method != "GET" and response.status_code in (502, 504):
+                    break
+
+                # Honor the server's Retry-After if sent, otherwise back off
+                # exponentially with full jitter so concurrent workers don't
+                # retry in lockstep
+                retry_after = response.headers.get("Retry-After")
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = random.random() * min(self.BACKOFF_CAP, 2.0**attempt)
+                self.logger.warning("Got %s from %s, retrying in %.1fs", response.status_code, url, delay)
+                time.sleep(delay)
+
+            if response.status_code == 304 and cached is not None:
+                return cached[1]
+
             response.raise_for_status()
 
             # Some endpoints return empty response
             if response.status_code == 204 or not response.content:
                 return {}
 
-            return response.json()
+            # orjson parses the body in C, a few times faster than the stdlib
+            # parser response.json() would use
+            data = orjson.loads(response.content)
+
+            if cache_key is not None:
+                etag = response.headers.get("ETag")
+                if etag:
+                    with self._etag_cache_lock:
+                        self._etag_cache[cache_key] = (etag, data)
+                        # Evict oldest entries past the bound; dicts keep
+                        # insertion order, so the front is the oldest
+                        while len(self._etag_cache) > self.ETAG_CACHE_MAX:
+                            del self._etag_cache[next(iter(self._etag_cache))]
+                        self._etag_cache_dirty = True
+
+            return data
+        except requests.exceptions.HTTPError as e:
+            # HTTPError always carries the response; no hasattr dance needed
+            self.logger.error("API request failed: %s; response: %s", e, e.response.text)
+            raise TickTickAPIError(f"API request failed: {e}")
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"API request failed: {e}")
-            if hasattr(e, "response") and e.response is not None:
-                self.logger.error(f"Response: {e.response.text}")
+            self.logger.error("API request failed: %s", e)
             raise TickTickAPIError(f"API request failed: {e}")
 
     def get_projects(self) -> list[dict[str, Any]]:
         """
         Get all projects/lists
 
+        The response is cached in-memory for PROJECTS_CACHE_TTL seconds since
+        project lists change rarely but are re-read on every automation run.
+
         Returns:
             list of project objects
         """
-        endpoint = "/project"
-        response = self._make_request("GET", "v1", endpoint)
-        return response if isinstance(response, list) else []
+        if self._projects_cache is not None and time.monotonic() - self._projects_cache[0] < self.PROJECTS_CACHE_TTL:
+            return self._projects_cache[1]
+
+        projects = self._get_list("v1", "/project")
+        self._projects_cache = (time.monotonic(), projects)
+        return projects
+
+    def invalidate_projects_cache(self):
+        """Drop the cached project list so the next get_projects refetches"""
+        self._projects_cache = None
 
     def get_project_data(self, project_id: str) -> dict[str, Any]:
         """
@@ -156,10 +620,27 @@ class TickTickClient:
         Returns:
             Project data object
         """
-        endpoint = f"/project/{project_id}/data"
+        endpoint = "/project/" + project_id + "/data"
         response = self._make_request("GET", "v1", endpoint)
         return response if isinstance(response, dict) else {}
 
+    def iter_project_tasks(self, project_id: str) -> Iterator[dict[str, Any]]:
+        """
+        Stream the tasks of a project/list one at a time
+
+        Unlike get_project_data, the response is parsed incrementally while it
+        downloads, so peak memory stays at one task's footprint and callers
+        scanning for a particular task can stop without parsing the rest.
+
+        Args:
+            project_id: Project/list ID
+
+        Yields:
+            Task objects
+        """
+        endpoint = "/project/" + project_id + "/data"
+        return self._stream_request("GET", "v1", endpoint, "tasks.item")
+
     def get_all_pending_tasks(self, project_id: str | None = None) -> list[dict[str, Any]]:
         """
         Get list of all pending tasks
@@ -171,22 +652,114 @@ class TickTickClient:
             list of all task objects
         """
         if project_id is None:
+            # The v2 batch-sync endpoint returns pending tasks for every
+            # project in a single call; prefer it over N per-project fetches
+            # and fall back to the fan-out if it ever goes away
+            try:
+                response = self._make_request("GET", "v2", "/batch/check/0")
+                return response.get("syncTaskBean", {}).get("update", [])
+            except TickTickAPIError:
+                self.logger.warning("Batch sync endpoint unavailable, falling back to per-project fetches")
             project_ids = [proj["id"] for proj in self.get_projects()]
         else:
             project_ids = [project_id]
 
-        tasks = []
-        for project_id in project_ids:
-            response = self.get_project_data(project_id)
-            tasks.extend(response.get("tasks", []))
+        # The per-project fetches are independent round trips; fan them out
+        # over the pooled session instead of paying N sequential RTTs, and
+        # flatten the per-project lists lazily into the single result list
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            return list(
+                chain.from_iterable(
+                    response.get("tasks", ()) for response in executor.map(self.get_project_data, project_ids)
+                )
+            )
+
+    def get_completed_tasks(
+        self,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        limit: int = 100,
+        stream: bool = False,
+    ) -> list[dict[str, Any]] | Iterator[dict[str, Any]]:
+        """
+        Get completed tasks across all projects/lists
+
+        Filtering is pushed down to the server via query params, so only tasks
+        completed inside the requested window are transferred and parsed
+        instead of fetching everything and filtering client-side.
+
+        Args:
+            from_date: Only return tasks completed at or after this time
+            to_date: Only return tasks completed at or before this time
+            limit: Maximum number of tasks to return
+            stream: If True, return a generator that parses tasks while the
+                response is still downloading instead of materializing the list
+
+        Returns:
+            list of completed task objects (a generator when `stream` is True)
+        """
+        endpoint = "/project/all/completed"
+        # Built as a list of pairs: requests accepts pair sequences directly
+        # and skips the dict copy PreparedRequest would otherwise make
+        params: list[tuple[str, Any]] = [("limit", limit)]
+        if from_date is not None:
+            params.append(("from", from_date.strftime("%Y-%m-%d %H:%M:%S")))
+        if to_date is not None:
+            params.append(("to", to_date.strftime("%Y-%m-%d %H:%M:%S")))
+
+        if stream:
+            return self._stream_request("GET", "v2", endpoint, "item", params=params)
+
+        tasks = self._get_list("v2", endpoint, params=params)
+
+        # The from param should be honored by the (undocumented) endpoint, but
+        # re-check the window as a safeguard until one fetch proves it is: if
+        # a probe finds nothing out of range, later calls skip the re-check
+        # entirely. The bound is computed once as epoch seconds, the parser is
+        # pre-bound to a local, and each kept task costs one float compare.
+        # Tasks with no parseable completedTime are kept as the server sent them
+        if from_date is not None and self._server_filters_completed is not True:
+            from_ts = from_date.timestamp()
+            parse = _completed_time_ts
+            filtered = [t for t in tasks if (ts := parse(t.get("completedTime"))) is None or ts >= from_ts]
+            if self._server_filters_completed is None and tasks:
+                self._server_filters_completed = len(filtered) == len(tasks)
+            tasks = filtered
         return tasks
 
     def get_task(self, project_id: str, task_id) -> list[dict[str, Any]]:
         """Get details of a particular task"""
-        endpoint = f"/project/{project_id}/task/{task_id}"
+        endpoint = "/project/" + project_id + "/task/" + task_id
         response = self._make_request("GET", "v1", endpoint)
         return response if isinstance(response, dict) else {}
 
+    def get_tasks_bulk(self, project_id: str, task_ids: list[str]) -> list[dict[str, Any] | None]:
+        """
+        Get details of multiple tasks of a project concurrently
+
+        The per-task GETs fan out over the pooled session so N lookups cost
+        roughly one round trip. Failures are per-item: a task that cannot be
+        fetched (e.g. deleted in the meantime) yields None in its slot instead
+        of aborting the whole batch.
+
+        Args:
+            project_id: Project/list ID
+            task_ids: Task IDs to fetch
+
+        Returns:
+            Task objects in the same order as `task_ids`, None for failures
+        """
+
+        def fetch(task_id: str) -> dict[str, Any] | None:
+            try:
+                return self.get_task(project_id, task_id)
+            except TickTickAPIError as e:
+                self.logger.warning("Failed to fetch task %s: %s", task_id, e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            return list(executor.map(fetch, task_ids))
+
     def create_task(self, task_data: dict[str, Any]) -> dict[str, Any]:
         """
         Create a new task
@@ -198,4 +771,71 @@ class TickTickClient:
             Created task object
         """
         endpoint = "/task"
-        return self._make_request("POST", "v1", endpoint, json=task_data)
+        self._throttle_create()
+        # Encode the body with orjson rather than requests' stdlib json= path;
+        # the session's default Content-Type is already application/json
+        return self._make_request("POST", "v1", endpoint, data=orjson.dumps(task_data))
+
+    def _update_pacing(self, headers) -> None:
+        """
+        Derive a send delay from the server's rate-limit headers
+
+        While plenty of budget remains this is a no-op. Once the reported
+        remaining count drops to RATE_REMAINING_THRESHOLD, the next request is
+        delayed by an even share of the reset window, converting would-be 429
+        retries (a wasted round trip plus backoff each) into short preemptive
+        waits.
+        """
+        try:
+            remaining = int(headers.get("X-RateLimit-Remaining", ""))
+            reset = float(headers.get("X-RateLimit-Reset", ""))
+        except (TypeError, ValueError):
+            return
+        if remaining > self.RATE_REMAINING_THRESHOLD:
+            return
+        # Some APIs send the reset as an absolute epoch rather than seconds
+        # remaining; normalize to a duration
+        if reset > 1e6:
+            reset = max(reset - time.time(), 0.0)
+        self._pace_until = time.monotonic() + reset / max(remaining, 1)
+
+    def _throttle_create(self):
+        """
+        Block until a create slot is free under CREATE_RATE_LIMIT
+
+        Pacing creations below the API's posted limit avoids triggering 429
+        responses whose retries would cost far more than the wait.
+        """
+        while True:
+            with self._create_bucket_lock:
+                now = time.monotonic()
+                while self._create_bucket and now - self._create_bucket[0] > 1.0:
+                    self._create_bucket.popleft()
+                if len(self._create_bucket) < self.CREATE_RATE_LIMIT:
+                    self._create_bucket.append(now)
+                    return
+                wait = 1.0 - (now - self._create_bucket[0])
+            time.sleep(max(wait, 0.01))
+
+    def create_tasks_bulk(self, tasks_data: list[dict[str, Any]], batch_size: int = 50) -> list[dict[str, Any]]:
+        """
+        Create multiple tasks concurrently
+
+        The open API has no documented batch-create endpoint, so requests are
+        multiplexed over the shared session with a thread pool instead of being
+        issued one blocking round trip at a time. Tasks are submitted in batches
+        of `batch_size` to keep the number of in-flight requests bounded.
+
+        Args:
+            tasks_data: Task objects containing task details
+            batch_size: Maximum number of tasks submitted to the pool at once
+
+        Returns:
+            Created task objects, in the same order as `tasks_data`
+        """
+        created = []
+        tasks_iter = iter(tasks_data)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            while batch := list(islice(tasks_iter, batch_size)):
+                created.extend(executor.map(self.create_task, batch))
+        return created
@@ -0,0 +1,239 @@
+"""
+Async TickTick API Client with OAuth Authentication
+
+This module mirrors ticktick_api.TickTickClient on top of aiohttp so callers
+can issue many API calls concurrently (e.g. via asyncio.gather) over one
+pooled connection instead of paying sequential round trips.
+Documentation: https://developer.ticktick.com/api
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+import aiohttp
+
+from .ticktick_api import TickTickAPIError, TickTickClient
+
+
+class AsyncTickTickClient:
+    """Async client for interacting with TickTick Open API with OAuth2"""
+
+    BASE_URL_v1 = TickTickClient.BASE_URL_v1
+    BASE_URL_v2 = TickTickClient.BASE_URL_v2
+    AUTH_URL = TickTickClient.AUTH_URL
+
+    # Bound on concurrent in-flight requests, matching the connector limit
+    MAX_CONCURRENCY = 10
+
+    def __init__(self, client_id: str, client_secret: str, access_token: str | None = None):
+        """
+        Initialize async TickTick client with OAuth credentials
+
+        Args:
+            client_id: OAuth client ID
+            client_secret: OAuth client secret
+            access_token: cached access token
+        """
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.access_token = access_token
+        self.token_expires_at = None
+        self._base_urls = {"v1": self.BASE_URL_v1, "v2": self.BASE_URL_v2}
+        self._session: aiohttp.ClientSession | None = None
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Lazily created shared session; created on first use so the client
+        can be constructed outside a running event loop"""
+        if self._session is None or self._session.closed:
+            headers = {"Content-Type": "application/json"}
+            if self.access_token:
+                headers["Authorization"] = f"Bearer {self.access_token}"
+            self._session = aiohttp.ClientSession(
+                headers=headers,
+                connector=aiohttp.TCPConnector(limit=self.MAX_CONCURRENCY, keepalive_timeout=75),
+            )
+        return self._session
+
+    async def close(self):
+        """Close the underlying session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncTickTickClient":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def authenticate(self, code: str | None = None, redirect_uri: str | None = None):
+        """
+        Authenticate with TickTick OAuth
+
+        Args:
+            code: Authorization code from OAuth flow (if available)
+            redirect_uri: Redirect URI used in OAuth flow
+
+        Note:
+            If code is not provided, you need to obtain an access token through
+            the OAuth flow manually and initialize the client with it.
+        """
+        if not code:
+            raise TickTickAPIError(
+                "OAuth code required. Please complete the OAuth flow manually:\n"
+                f"1. Visit: https://ticktick.com/oauth/authorize?client_id={self.client_id}&scope=tasks:read tasks:write&redirect_uri={{redirect_uri}}\n"
+                "2. Get the authorization code\n"
+                "3. Exchange it for an access token using the /oauth/token endpoint"
+            )
+
+        try:
+            async with self.session.post(
+                self.AUTH_URL,
+                data={
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                    "code": code,
+                    "grant_type": "authorization_code",
+                    "redirect_uri": redirect_uri or "http://localhost",
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            ) as response:
+                response.raise_for_status()
+                token_data = await response.json()
+
+            self.access_token = token_data.get("access_token")
+            self.token_expires_at = datetime.now() + timedelta(seconds=token_data.get("expires_in", 3600))
+            # Recreate the session lazily so it picks up the new bearer token
+            await self.close()
+            return token_data
+        except aiohttp.ClientError as e:
+            self.logger.error("Authentication failed: %s", e)
+            raise TickTickAPIError(f"Authentication failed: {e}")
+
+    async def _make_request(self, method: str, api_ver: str, endpoint: str, **kwargs) -> dict[str, Any]:
+        """
+        Make HTTP request to TickTick API
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            api_ver: API version. v1 or v2 (undocumented)
+            endpoint: API endpoint path
+            **kwargs: Additional arguments to pass to aiohttp
+
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            TickTickAPIError: If the API request fails
+        """
+        if not self.access_token:
+            raise TickTickAPIError("Not authenticated. Please authenticate first.")
+
+        try:
+            url = self._base_urls[api_ver] + endpoint
+        except KeyError:
+            raise ValueError(f"Invalid API version: {api_ver}")
+
+        try:
+            async with self._semaphore:
+                async with self.session.request(method, url, **kwargs) as response:
+                    response.raise_for_status()
+
+                    # Some endpoints return empty response
+                    if response.status == 204 or response.content_length == 0:
+                        return {}
+
+                    return await response.json(content_type=None)
+        except aiohttp.ClientError as e:
+            self.logger.error("API request failed: %s", e)
+            raise TickTickAPIError(f"API request failed: {e}")
+
+    async def get_projects(self) -> list[dict[str, Any]]:
+        """
+        Get all projects/lists
+
+        Returns:
+            list of project objects
+        """
+        response = await self._make_request("GET", "v1", "/project")
+        return response if isinstance(response, list) else []
+
+    async def get_project_data(self, project_id: str) -> dict[str, Any]:
+        """
+        Get detailed data of a specific project/list
+
+        Args:
+            project_id: Project/list ID
+
+        Returns:
+            Project data object
+        """
+        response = await self._make_request("GET", "v1", f"/project/{project_id}/data")
+        return response if isinstance(response, dict) else {}
+
+    async def get_all_pending_tasks(self, project_id: str | None = None) -> list[dict[str, Any]]:
+        """
+        Get list of all pending tasks
+
+        The per-project fetches run concurrently via asyncio.gather, bounded
+        by the client's semaphore.
+
+        Args:
+            project_id: project/list ID to filter tasks
+
+        Returns:
+            list of all task objects
+        """
+        if project_id is None:
+            project_ids = [proj["id"] for proj in await self.get_projects()]
+        else:
+            project_ids = [project_id]
+
+        responses = await asyncio.gather(*(self.get_project_data(pid) for pid in project_ids))
+        return [task for response in responses for task in response.get("tasks", [])]
+
+    async def get_completed_tasks(
+        self,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """
+        Get completed tasks across all projects/lists
+
+        Args:
+            from_date: Only return tasks completed at or after this time
+            to_date: Only return tasks completed at or before this time
+            limit: Maximum number of tasks to return
+
+        Returns:
+            list of completed task objects
+        """
+        params: dict[str, Any] = {"limit": limit}
+        if from_date is not None:
+            params["from"] = from_date.strftime("%Y-%m-%d %H:%M:%S")
+        if to_date is not None:
+            params["to"] = to_date.strftime("%Y-%m-%d %H:%M:%S")
+        response = await self._make_request("GET", "v2", "/project/all/completed", params=params)
+        return response if isinstance(response, list) else []
+
+    async def get_task(self, project_id: str, task_id) -> dict[str, Any]:
+        """Get details of a particular task"""
+        response = await self._make_request("GET", "v1", f"/project/{project_id}/task/{task_id}")
+        return response if isinstance(response, dict) else {}
+
+    async def create_task(self, task_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Create a new task
+
+        Args:
+            task_data: Task object containing task details
+
+        Returns:
+            Created task object
+        """
+        return await self._make_request("POST", "v1", "/task", json=task_data)